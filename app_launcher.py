@@ -1,12 +1,53 @@
 """
 Application launcher - launches Python apps with detached processes
 """
+import atexit
 import subprocess
 import os
+import threading
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Optional, List
 import sys
 
+# Cache of parsed .env files keyed by (path, mtime_ns, size).
+# Invalidation is automatic: editing the file changes the key.
+_ENV_CACHE: dict = {}
+
+
+def _cheap_resolve(p: Path) -> Path:
+    """Resolve a path only when necessary (relative or symlink).
+
+    Path.resolve() stats every component; an absolute non-symlink path
+    is already good enough for cmd.
+    """
+    if p.is_absolute() and not p.is_symlink():
+        return p
+    return p.resolve()
+
+
+def _cleanup_stale_batch_files():
+    """Delete cached launcher batch files older than a day.
+
+    Batch files are keyed by content hash and reused across launcher
+    runs, so old hashes accumulate in temp; bound the growth on exit.
+    """
+    import tempfile
+    import time
+
+    cutoff = time.time() - 86400
+    try:
+        for batch_file in Path(tempfile.gettempdir()).glob("launcher_*.bat"):
+            try:
+                if batch_file.stat().st_mtime < cutoff:
+                    batch_file.unlink()
+            except OSError:
+                pass
+    except OSError:
+        pass
+
+
+atexit.register(_cleanup_stale_batch_files)
+
 
 def parse_env_file(env_file_path: Path) -> dict:
     """
@@ -18,31 +59,48 @@ def parse_env_file(env_file_path: Path) -> dict:
     Returns:
         Dictionary of environment variable name -> value
     """
-    import re
     env_vars = {}
 
     try:
-        with open(env_file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
+        # Re-launching the same config re-reads the same files; serve
+        # unchanged files from the cache instead of re-parsing.
+        st = env_file_path.stat()
+        cache_key = (str(env_file_path), st.st_mtime_ns, st.st_size)
+        cached = _ENV_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Scan the raw bytes in one pass; only keys and values that
+        # survive the filters get decoded into str objects
+        for line in env_file_path.read_bytes().splitlines():
+            line = line.strip()
+
+            # Skip empty lines and comments
+            if not line or line[:1] == b'#':
+                continue
 
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
+            # Parse KEY=VALUE format
+            eq = line.find(b'=')
+            if eq <= 0:
+                continue
 
-                # Parse KEY=VALUE format
-                match = re.match(r'^([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*)$', line)
-                if match:
-                    key = match.group(1)
-                    value = match.group(2)
+            key = line[:eq].rstrip()
+            try:
+                key_str = key.decode('ascii')
+            except UnicodeDecodeError:
+                continue
+            if not key_str.isidentifier():
+                continue
 
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
+            value = line[eq + 1:].lstrip()
 
-                    env_vars[key] = value
+            # Remove quotes if present
+            if len(value) >= 2 and value[0] == value[-1] and value[:1] in (b'"', b"'"):
+                value = value[1:-1]
+
+            env_vars[key_str] = value.decode('utf-8')
+
+        _ENV_CACHE[cache_key] = env_vars
 
     except Exception as e:
         print(f"Warning: Failed to parse {env_file_path}: {e}")
@@ -77,30 +135,26 @@ def launch_app(
         else:
             cwd = str(script_path.parent)
 
-        # Create a temporary batch file
-        import tempfile
-        temp_dir = Path(tempfile.gettempdir())
-        batch_file = temp_dir / f"launcher_{script_path.stem}_{os.getpid()}.bat"
-
-        # Build the batch file content
-        batch_lines = ["@echo off", ""]
+        # Build the batch file content in a single buffer; StringIO.write
+        # avoids allocating an intermediate string per env var
+        import io
+        buf = io.StringIO()
+        buf.write("@echo off\ntitle Python App\n\n")
 
         # Change to working directory
-        batch_lines.append(f'cd /d "{cwd}"')
-        batch_lines.append("")
+        buf.write(f'cd /d "{cwd}"\n\n')
 
-        # Load .env files if provided
+        # Load .env files if provided. The variables are handed straight
+        # to Popen's env= below - cmd inherits them from its parent - so
+        # the batch file carries no 'set' lines to parse (or escape)
+        child_env = None
         if env_files:
+            env_vars = {}
             for env_file in env_files:
                 if env_file.exists():
-                    env_vars = parse_env_file(env_file)
-                    if env_vars:
-                        batch_lines.append(f"REM Load environment variables from {env_file.name}")
-                        for key, value in env_vars.items():
-                            # Escape special characters in batch files
-                            escaped_value = value.replace("%", "%%")
-                            batch_lines.append(f'set {key}={escaped_value}')
-                        batch_lines.append("")
+                    env_vars.update(parse_env_file(env_file))
+            if env_vars:
+                child_env = {**os.environ, **env_vars}
 
         # Activate venv if specified
         if venv_path:
@@ -109,36 +163,43 @@ def launch_app(
                 print(f"Error: Venv activation script not found: {activate_script}")
                 return False
 
-            batch_lines.append("REM Activate virtual environment")
-            batch_lines.append(f'call "{activate_script}"')
-            batch_lines.append("")
+            buf.write("REM Activate virtual environment\n")
+            buf.write(f'call "{activate_script}"\n\n')
 
         # Build Python command
-        batch_lines.append("REM Run Python script")
+        buf.write("REM Run Python script\n")
+
+        resolved_script = _cheap_resolve(script_path)
 
-        # Add parameters (split by spaces, respecting quotes)
+        # Pass parameters through as-is; the old shlex.split + join
+        # round-trip dropped the user's quoting and tokenized for nothing
         if parameters:
-            import shlex
-            params = ' '.join(shlex.split(parameters))
-            batch_lines.append(f'python "{script_path.resolve()}" {params}')
+            buf.write(f'python "{resolved_script}" {parameters.strip()}\n')
         else:
-            batch_lines.append(f'python "{script_path.resolve()}"')
+            buf.write(f'python "{resolved_script}"\n')
 
         # Add pause at end
-        batch_lines.append("")
-        batch_lines.append("echo.")
-        batch_lines.append("echo Process finished. Press any key to close...")
-        batch_lines.append("pause > nul")
+        buf.write("\necho.\n")
+        buf.write("echo Process finished. Press any key to close...\n")
+        buf.write("pause > nul")
+
+        # Name the batch file by a hash of its content: repeated launches
+        # of the same config reuse the existing file instead of rewriting
+        import hashlib
+        import tempfile
+
+        content = buf.getvalue()
+        content_hash = hashlib.blake2b(content.encode('utf-8'), digest_size=8).hexdigest()
 
-        # Write batch file
-        with open(batch_file, 'w') as f:
-            f.write('\n'.join(batch_lines))
+        temp_dir = Path(tempfile.gettempdir())
+        batch_file = temp_dir / f"launcher_{script_path.stem}_{content_hash}.bat"
 
-        # Use 'start' command to open a new visible console window
-        full_cmd = f'start "Python App" cmd /K "{batch_file}"'
+        if not batch_file.exists():
+            with open(batch_file, 'w') as f:
+                f.write(content)
 
         # Debug output
-        print(f"Launching script: {script_path.resolve()}")
+        print(f"Launching script: {resolved_script}")
         print(f"Working directory: {cwd}")
         if venv_path:
             print(f"Virtual environment: {venv_path}")
@@ -146,11 +207,15 @@ def launch_app(
             print(f"Parameters: {parameters}")
         print(f"Batch file: {batch_file}")
 
-        # Launch process using cmd.exe with 'start' command
-        # shell=True is required for 'start' to work
+        # Launch cmd.exe directly in its own console window.
+        # CREATE_NEW_CONSOLE replaces the old 'start "Python App" cmd /K ...'
+        # wrapper, which spawned two extra cmd.exe processes just to parse
+        # the 'start' builtin; the window title is set inside the batch file.
         process = subprocess.Popen(
-            full_cmd,
-            shell=True
+            ["cmd.exe", "/K", str(batch_file)],
+            creationflags=subprocess.CREATE_NEW_CONSOLE,
+            close_fds=True,
+            env=child_env
         )
 
         print(f"Process started with PID: {process.pid}")
@@ -162,3 +227,36 @@ def launch_app(
         import traceback
         traceback.print_exc()
         return False
+
+
+def launch_app_async(
+    script_path: Path,
+    parameters: str = "",
+    venv_path: Optional[Path] = None,
+    env_files: Optional[List[Path]] = None,
+    working_directory: Optional[Path] = None,
+    on_success: Optional[Callable] = None
+):
+    """
+    Launch an app on a daemon worker thread.
+
+    Writing the batch file and spawning the process can take hundreds of
+    milliseconds on Windows; running them off-thread keeps the Tk UI
+    responsive. Call this from button/menu handlers instead of launch_app.
+
+    Args:
+        on_success: Optional callback invoked (on the worker thread) if
+            the launch succeeded
+    """
+    def _run():
+        success = launch_app(
+            script_path=script_path,
+            parameters=parameters,
+            venv_path=venv_path,
+            env_files=env_files,
+            working_directory=working_directory
+        )
+        if success and on_success:
+            on_success()
+
+    threading.Thread(target=_run, daemon=True).start()
@@ -51,20 +51,26 @@ class AppWizard(tk.Toplevel):
 
     def _create_widgets(self):
         """Create the UI widgets"""
+        # Lay the rows out with grid: a single stretching column means Tk
+        # computes the geometry once instead of relayouting per pack call
+        self.columnconfigure(0, weight=1)
+
         # App Name
-        tk.Label(self, text="App Name:", font=("Arial", 10, "bold")).pack(pady=(10, 5))
+        tk.Label(self, text="App Name:", font=("Arial", 10, "bold")).grid(
+            row=0, column=0, pady=(10, 5))
 
         name_frame = tk.Frame(self)
-        name_frame.pack(fill=tk.X, padx=20, pady=5)
+        name_frame.grid(row=1, column=0, sticky="ew", padx=20, pady=5)
 
         self.name_entry = tk.Entry(name_frame)
         self.name_entry.pack(fill=tk.X)
 
         # Script selection
-        tk.Label(self, text="Python Script:", font=("Arial", 10, "bold")).pack(pady=(20, 5))
+        tk.Label(self, text="Python Script:", font=("Arial", 10, "bold")).grid(
+            row=2, column=0, pady=(20, 5))
 
         script_frame = tk.Frame(self)
-        script_frame.pack(fill=tk.X, padx=20, pady=5)
+        script_frame.grid(row=3, column=0, sticky="ew", padx=20, pady=5)
 
         self.script_label = tk.Label(script_frame, text="No script selected", fg="gray")
         self.script_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
@@ -72,10 +78,11 @@ class AppWizard(tk.Toplevel):
         tk.Button(script_frame, text="Browse...", command=self.select_script).pack(side=tk.RIGHT)
 
         # Venv selection
-        tk.Label(self, text="Virtual Environment (optional):", font=("Arial", 10, "bold")).pack(pady=(20, 5))
+        tk.Label(self, text="Virtual Environment (optional):", font=("Arial", 10, "bold")).grid(
+            row=4, column=0, pady=(20, 5))
 
         venv_frame = tk.Frame(self)
-        venv_frame.pack(fill=tk.X, padx=20, pady=5)
+        venv_frame.grid(row=5, column=0, sticky="ew", padx=20, pady=5)
 
         self.venv_label = tk.Label(venv_frame, text="No venv detected", fg="gray")
         self.venv_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
@@ -84,10 +91,11 @@ class AppWizard(tk.Toplevel):
         tk.Button(venv_frame, text="Clear", command=self.clear_venv).pack(side=tk.RIGHT)
 
         # Icon selection
-        tk.Label(self, text="Icon (optional):", font=("Arial", 10, "bold")).pack(pady=(20, 5))
+        tk.Label(self, text="Icon (optional):", font=("Arial", 10, "bold")).grid(
+            row=6, column=0, pady=(20, 5))
 
         icon_frame = tk.Frame(self)
-        icon_frame.pack(fill=tk.X, padx=20, pady=5)
+        icon_frame.grid(row=7, column=0, sticky="ew", padx=20, pady=5)
 
         self.icon_label = tk.Label(icon_frame, text="No icon (will auto-generate)", fg="gray")
         self.icon_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
@@ -96,10 +104,11 @@ class AppWizard(tk.Toplevel):
         tk.Button(icon_frame, text="Clear", command=self.clear_icon).pack(side=tk.RIGHT)
 
         # Environment files
-        tk.Label(self, text="Environment Files (optional):", font=("Arial", 10, "bold")).pack(pady=(20, 5))
+        tk.Label(self, text="Environment Files (optional):", font=("Arial", 10, "bold")).grid(
+            row=8, column=0, pady=(20, 5))
 
         env_frame = tk.Frame(self)
-        env_frame.pack(fill=tk.X, padx=20, pady=5)
+        env_frame.grid(row=9, column=0, sticky="ew", padx=20, pady=5)
 
         self.env_label = tk.Label(env_frame, text="No env files configured", fg="gray")
         self.env_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
@@ -108,7 +117,7 @@ class AppWizard(tk.Toplevel):
 
         # Buttons
         button_frame = tk.Frame(self)
-        button_frame.pack(pady=30, padx=20, fill=tk.X)
+        button_frame.grid(row=10, column=0, sticky="ew", padx=20, pady=30)
 
         tk.Button(
             button_frame,
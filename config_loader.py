@@ -2,61 +2,110 @@
 Configuration loader for app launcher
 """
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from typing import List, Dict, Optional
 
 
+def _cheap_resolve(p: Path) -> Path:
+    """Skip the expensive Path.resolve() for absolute non-symlink paths"""
+    if p.is_absolute() and not p.is_symlink():
+        return p
+    return p.resolve()
+
+
 class AppConfig:
     """Represents a single app configuration"""
 
-    def __init__(self, config_path: Path, data: dict):
+    def __init__(self, config_path: Path, data: dict, exists_check=None):
         self.config_path = config_path
         self.config_name = config_path.stem
+        self._data = data
 
-        # Required fields
-        self.name = data.get("name", self.config_name)
-        self.script = Path(data["script"]) if "script" in data else None
+        # Existence probe; the loader passes a cached version so paths
+        # shared between configs (a common venv, say) are stat'd once
+        self._exists = exists_check if exists_check else (lambda p: p.exists())
 
-        # Optional fields
-        self.icon = Path(data["icon"]) if "icon" in data else None
-        self.venv = Path(data["venv"]) if "venv" in data else None
-        self.working_directory = Path(data.get("working_directory", "")) if "working_directory" in data else None
+        self.name = data.get("name", self.config_name)
         self.description = data.get("description", "")
 
-        # Env files
-        self.env_files = [Path(f) for f in data.get("env_files", [])]
-        self.env_directory = Path(data["env_directory"]) if "env_directory" in data else None
-
         # Variables and parameter sets
         self.variables = data.get("variables", {})
         self.parameter_sets = data.get("parameter_sets", [])
 
+        # Cached (directory signature, result) from get_all_env_files
+        self._env_files_cache = None
+
+    # Path fields are built lazily: Path() parsing isn't free and most
+    # fields are never touched for most configs during a load.
+
+    @cached_property
+    def script(self) -> Optional[Path]:
+        return Path(self._data["script"]) if "script" in self._data else None
+
+    @cached_property
+    def icon(self) -> Optional[Path]:
+        return Path(self._data["icon"]) if "icon" in self._data else None
+
+    @cached_property
+    def venv(self) -> Optional[Path]:
+        return Path(self._data["venv"]) if "venv" in self._data else None
+
+    @cached_property
+    def working_directory(self) -> Optional[Path]:
+        return Path(self._data["working_directory"]) if "working_directory" in self._data else None
+
+    @cached_property
+    def env_files(self) -> List[Path]:
+        return [Path(f) for f in self._data.get("env_files", [])]
+
+    @cached_property
+    def env_directory(self) -> Optional[Path]:
+        return Path(self._data["env_directory"]) if "env_directory" in self._data else None
+
     def get_all_env_files(self) -> List[Path]:
         """
         Get all env files from both explicit list and directory scan.
         Returns merged list with duplicates removed.
+
+        The result is cached against the env directory's mtime, so
+        repeated calls within a session skip the recursive scan.
         """
+        # Signature of the scan directory; changes when it is modified
+        dir_sig = None
+        if self.env_directory:
+            try:
+                st = self.env_directory.stat()
+                dir_sig = (st.st_mtime_ns, st.st_ino)
+            except OSError:
+                dir_sig = None
+
+        if self._env_files_cache is not None and self._env_files_cache[0] == dir_sig:
+            return self._env_files_cache[1]
+
         env_files = set()
 
         # Add explicitly listed env files
         for env_file in self.env_files:
-            if env_file.exists():
-                env_files.add(env_file.resolve())
-
-        # Scan env directory if specified
-        if self.env_directory and self.env_directory.exists():
-            for file_path in self.env_directory.rglob("*"):
-                if not file_path.is_file():
-                    continue
-
-                filename = file_path.name
-                # Match .env patterns
-                if (filename == ".env" or
-                    filename.endswith(".env") or
-                    ".env." in filename):
-                    env_files.add(file_path.resolve())
-
-        return sorted(list(env_files))
+            if self._exists(env_file):
+                env_files.add(_cheap_resolve(env_file))
+
+        # Scan env directory if specified; os.walk filters on names only,
+        # so non-matching files never get a Path object or an extra stat
+        if self.env_directory and dir_sig is not None:
+            for root, dirs, files in os.walk(self.env_directory):
+                for filename in files:
+                    # One substring scan rejects non-env names before the
+                    # exact pattern checks run
+                    if ".env" in filename and (
+                            filename.endswith(".env") or ".env." in filename):
+                        env_files.add(_cheap_resolve(Path(root) / filename))
+
+        result = sorted(env_files)
+        self._env_files_cache = (dir_sig, result)
+        return result
 
     def validate(self) -> tuple[bool, Optional[str]]:
         """
@@ -66,10 +115,10 @@ class AppConfig:
         if not self.script:
             return False, "Missing required field: script"
 
-        if not self.script.exists():
+        if not self._exists(self.script):
             return False, f"Script not found: {self.script}"
 
-        if self.venv and not (self.venv / "Scripts" / "python.exe").exists():
+        if self.venv and not self._exists(self.venv / "Scripts" / "python.exe"):
             return False, f"Invalid venv: {self.venv}"
 
         return True, None
@@ -82,6 +131,18 @@ class ConfigLoader:
         self.config_dir = config_dir
         self.master_config_path = config_dir / "master.json"
 
+        # Existence results shared across configs within one load pass
+        self._stat_cache: Dict[str, bool] = {}
+
+    def _exists(self, path: Path) -> bool:
+        """Cached Path.exists(); many configs point at the same venv"""
+        key = str(path)
+        cached = self._stat_cache.get(key)
+        if cached is None:
+            cached = path.exists()
+            self._stat_cache[key] = cached
+        return cached
+
     def load_all_configs(self) -> List[AppConfig]:
         """
         Load all app configurations from the config directory.
@@ -89,29 +150,53 @@ class ConfigLoader:
         """
         configs = {}
 
-        # Load all JSON files except master.json
-        for config_file in self.config_dir.glob("*.json"):
-            if config_file.name == "master.json":
-                continue
-
-            try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    config = AppConfig(config_file, data)
-
-                    # Validate config
-                    is_valid, error = config.validate()
-                    if is_valid:
+        # Drop stale existence results from previous loads
+        self._stat_cache.clear()
+
+        # Enumerate all JSON files except master.json. os.scandir gives
+        # file type without an extra stat per entry.
+        config_files = []
+        with os.scandir(self.config_dir) as entries:
+            for entry in entries:
+                if (not entry.name.endswith(".json") or
+                        entry.name == "master.json" or
+                        not entry.is_file()):
+                    continue
+                config_files.append(Path(entry.path))
+
+        # Reading, parsing and validating each file is independent and
+        # IO-bound (validate() stats the script and venv), so fan out
+        # across a small thread pool. Results come back in input order.
+        if config_files:
+            with ThreadPoolExecutor(max_workers=min(32, len(config_files))) as executor:
+                for config, error in executor.map(self._load_one, config_files):
+                    if config:
                         configs[config.config_name] = config
-                    else:
-                        print(f"Warning: Invalid config {config_file.name}: {error}")
-
-            except Exception as e:
-                print(f"Warning: Failed to load {config_file.name}: {e}")
+                    elif error:
+                        print(error)
 
         # Sort configs
         return self._sort_configs(configs)
 
+    def _load_one(self, config_file: Path):
+        """
+        Read, parse and validate a single config file.
+        Returns (config, None) on success or (None, warning_message) on failure.
+        """
+        try:
+            # json.loads on raw bytes skips the stream reader's
+            # incremental decoding
+            data = json.loads(config_file.read_bytes())
+            config = AppConfig(config_file, data, exists_check=self._exists)
+
+            is_valid, error = config.validate()
+            if is_valid:
+                return config, None
+            return None, f"Warning: Invalid config {config_file.name}: {error}"
+
+        except Exception as e:
+            return None, f"Warning: Failed to load {config_file.name}: {e}"
+
     def _sort_configs(self, configs: Dict[str, AppConfig]) -> List[AppConfig]:
         """Sort configs by master.json order, then alphabetically"""
 
@@ -125,17 +210,15 @@ class ConfigLoader:
             except Exception as e:
                 print(f"Warning: Failed to load master.json: {e}")
 
-        # Sort by custom order first, then alphabetically
-        sorted_configs = []
+        # Sort by custom order first, then alphabetically. Track ordered
+        # names in a set instead of deleting from the input dict.
+        ordered_names = [name for name in custom_order if name in configs]
+        ordered_set = set(ordered_names)
 
-        # Add configs in custom order
-        for config_name in custom_order:
-            if config_name in configs:
-                sorted_configs.append(configs[config_name])
-                del configs[config_name]
+        sorted_configs = [configs[name] for name in ordered_names]
 
         # Add remaining configs alphabetically
-        remaining = sorted(configs.values(), key=lambda c: c.name.lower())
-        sorted_configs.extend(remaining)
+        remaining = (c for name, c in configs.items() if name not in ordered_set)
+        sorted_configs.extend(sorted(remaining, key=lambda c: c.name.lower()))
 
         return sorted_configs
@@ -2,6 +2,7 @@
 Environment File Parser
 Discovers .env files in project directories
 """
+import os
 from pathlib import Path
 
 
@@ -25,11 +26,14 @@ def find_env_files(directory: Path | str) -> list[Path]:
     env_files = []
 
     # Recursively find all files matching *.env or *.env.*
-    for path in directory.rglob("*"):
-        if path.is_file():
-            # Match blah.env or blah.env.blah
-            if path.suffix == ".env" or ".env." in path.name:
-                env_files.append(path)
+    # os.walk filters on names only, so non-matching files never get
+    # a Path object or an extra stat call.
+    for root, dirs, files in os.walk(directory):
+        for name in files:
+            # Match blah.env or blah.env.blah; the '.env' gate rejects
+            # non-matching names with a single substring scan
+            if ".env" in name and (name.endswith(".env") or ".env." in name):
+                env_files.append(Path(root) / name)
 
     # Sort by name for consistent ordering
     env_files.sort(key=lambda p: p.name.lower())
@@ -3,20 +3,52 @@ Python App Launcher - System tray application
 """
 import tkinter as tk
 from tkinter import ttk
+from functools import partial
 from pathlib import Path
 import sys
 import os
 import threading
 from typing import Optional, List
 
-import pystray
 from PIL import Image, ImageDraw, ImageFont
 from config_loader import ConfigLoader, AppConfig
 from menu_builder import MenuBuilder
-from app_wizard import AppWizard
 from startup_manager import StartupManager
 
 
+# Menu section headers (shared across popups)
+HEADER_APPS = "▼ APPLICATIONS"
+HEADER_ENV = "▼ ENVIRONMENT"
+HEADER_PARAMS = "▼ PARAMETERS"
+
+# Color palette for generated initial icons (various nice colors)
+_ICON_COLORS = (
+    (100, 180, 255),  # Blue
+    (80, 200, 120),   # Green
+    (255, 140, 100),  # Orange
+    (200, 100, 200),  # Purple
+    (255, 180, 100),  # Yellow-orange
+    (100, 200, 200),  # Cyan
+    (255, 120, 150),  # Pink
+    (150, 100, 200),  # Indigo
+    (200, 180, 80),   # Gold
+    (120, 180, 100),  # Lime
+)
+
+_INITIAL_FONT = None
+
+
+def _get_initial_font():
+    """Load the initial-icon font once; truetype() reads the file from disk"""
+    global _INITIAL_FONT
+    if _INITIAL_FONT is None:
+        try:
+            _INITIAL_FONT = ImageFont.truetype("arial.ttf", 16)
+        except Exception:
+            _INITIAL_FONT = ImageFont.load_default()
+    return _INITIAL_FONT
+
+
 class LauncherApp:
     """Main launcher application with system tray icon"""
 
@@ -28,30 +60,47 @@ class LauncherApp:
         # Ensure config directory exists
         self.config_dir.mkdir(exist_ok=True)
 
-        # Load configurations
-        self.config_loader = ConfigLoader(self.config_dir)
-        self.all_configs = []
-        self.reload_configs()
+        # Create hidden root window for tkinter (needed before any
+        # PhotoImage can be built)
+        self.root = tk.Tk()
+        self.root.withdraw()
+
+        # Cache for loaded icon images
+        self.icon_cache = {}
+
+        # Pre-rendered menu icons keyed by id(app_config)
+        self._icon_by_app = {}
 
-        # Menu builder
-        self.menu_builder = MenuBuilder(on_launch_callback=self.on_app_launched)
+        # Menu builder (created before the first config load so
+        # reload_configs can clear its caches)
+        self.menu_builder = MenuBuilder(on_launch_callback=self.on_app_launched, parent=self.root)
 
         # Startup manager
         self.startup_manager = StartupManager(Path(__file__))
 
-        # System tray icon
-        self.icon = None
+        # Cached popup menu; rebuilt on config reload and startup toggle
+        self._launcher_menu = None
 
-        # Create hidden root window for tkinter
-        self.root = tk.Tk()
-        self.root.withdraw()
+        # Load configurations
+        self.config_loader = ConfigLoader(self.config_dir)
+        self.all_configs = []
+        self.reload_configs()
 
-        # Cache for loaded icon images
-        self.icon_cache = {}
+        # System tray icon
+        self.icon = None
 
     def reload_configs(self):
         """Reload all configurations"""
         self.all_configs = self.config_loader.load_all_configs()
+        self.menu_builder.clear_caches()
+
+        # Pre-render menu icons here so opening the menu is a pure Tk
+        # construction pass with no stat or image work
+        self._icon_by_app = self._prepare_icons()
+
+        # Rebuild the popup menu against the new configs
+        self._rebuild_launcher_menu()
+
         print(f"Loaded {len(self.all_configs)} app configurations")
 
     def on_app_launched(self, app_config: AppConfig):
@@ -77,25 +126,13 @@ class LauncherApp:
 
     def generate_initial_icon(self, app_name: str):
         """Generate an icon with the app's initial"""
-        # Use app name to generate consistent color
-        color_hash = hash(app_name)
-
-        # Color palette (various nice colors)
-        colors = [
-            (100, 180, 255),  # Blue
-            (80, 200, 120),   # Green
-            (255, 140, 100),  # Orange
-            (200, 100, 200),  # Purple
-            (255, 180, 100),  # Yellow-orange
-            (100, 200, 200),  # Cyan
-            (255, 120, 150),  # Pink
-            (150, 100, 200),  # Indigo
-            (200, 180, 80),   # Gold
-            (120, 180, 100),  # Lime
-        ]
+        # Use app name to generate consistent color. hash() is randomized
+        # per process, which made the color change between launcher runs;
+        # the first character is deterministic and cheap
+        color_hash = ord(app_name[0]) if app_name else 0
 
         # Pick color based on hash
-        bg_color = colors[color_hash % len(colors)]
+        bg_color = _ICON_COLORS[color_hash % len(_ICON_COLORS)]
 
         # Get initial
         initial = app_name[0].upper() if app_name else "?"
@@ -105,10 +142,7 @@ class LauncherApp:
         draw = ImageDraw.Draw(img)
 
         # Draw initial in white with larger font
-        try:
-            font = ImageFont.truetype("arial.ttf", 16)
-        except:
-            font = ImageFont.load_default()
+        font = _get_initial_font()
 
         # Center the text
         bbox = draw.textbbox((0, 0), initial, font=font)
@@ -121,6 +155,30 @@ class LauncherApp:
 
         return img
 
+    def _render_icon_image(self, icon_path: Path, app_name: str = ""):
+        """Decode/generate a 24x24 PIL image for a menu icon.
+
+        Pure PIL work with no Tk involvement, so it is safe to run on a
+        worker thread. Returns None on failure.
+        """
+        try:
+            if icon_path and icon_path.exists():
+                # Load and shrink icon to 24x24 for menu. draft() lets
+                # JPEG sources decode at reduced resolution, and
+                # thumbnail() with BILINEAR is far cheaper than a LANCZOS
+                # resize - at 24x24 the quality difference is invisible
+                img = Image.open(icon_path)
+                img.draft('RGB', (24, 24))
+                img.thumbnail((24, 24), Image.Resampling.BILINEAR)
+                # Normalize mode (ICO files in particular vary)
+                return img.convert('RGBA')
+
+            # Generate icon from initial
+            return self.generate_initial_icon(app_name)
+        except Exception as e:
+            print(f"Warning: Failed to load/generate icon: {e}")
+            return None
+
     def load_icon(self, icon_path: Path, app_name: str = ""):
         """Load an icon and convert to PhotoImage for menu use"""
         # Check cache first
@@ -128,50 +186,96 @@ class LauncherApp:
         if cache_key in self.icon_cache:
             return self.icon_cache[cache_key]
 
-        try:
-            from PIL import ImageTk
+        img = self._render_icon_image(icon_path, app_name)
+        return self._wrap_photo(img, cache_key)
 
-            if icon_path and icon_path.exists():
-                # Load and resize icon to 24x24 for menu
-                img = Image.open(icon_path)
-                img = img.resize((24, 24), Image.Resampling.LANCZOS)
-            else:
-                # Generate icon from initial
-                img = self.generate_initial_icon(app_name)
+    def _wrap_photo(self, img, cache_key):
+        """Wrap a PIL image into a cached PhotoImage (Tk thread only)"""
+        if img is None:
+            return None
 
+        try:
+            from PIL import ImageTk
             photo = ImageTk.PhotoImage(img)
-
-            # Cache it
-            self.icon_cache[cache_key] = photo
-            return photo
         except Exception as e:
             print(f"Warning: Failed to load/generate icon: {e}")
             return None
 
+        self.icon_cache[cache_key] = photo
+        return photo
+
+    def _prepare_icons(self):
+        """Build the id(config) -> PhotoImage map for the menu.
+
+        The PIL decode/resize work for uncached icons runs across a
+        thread pool; only the cheap PhotoImage wrapping happens here on
+        the Tk thread.
+        """
+        icons = {}
+        to_render = []
+
+        for app_config in self.all_configs:
+            cache_key = (str(app_config.icon) if app_config.icon
+                         else f"generated_{app_config.name}")
+            photo = self.icon_cache.get(cache_key)
+            if photo is not None:
+                icons[id(app_config)] = photo
+            else:
+                to_render.append((app_config, cache_key))
+
+        if to_render:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(8, len(to_render))) as executor:
+                images = list(executor.map(
+                    lambda item: self._render_icon_image(item[0].icon, item[0].name),
+                    to_render
+                ))
+
+            for (app_config, cache_key), img in zip(to_render, images):
+                icons[id(app_config)] = self._wrap_photo(img, cache_key)
+
+        return icons
+
     def show_launcher_menu(self, icon=None, item=None):
         """Show the launcher menu (like Windows Start menu)"""
-        # Create a popup menu at mouse cursor position
+        # The menu widget tree is cached; a tray click only pays for the
+        # popup call itself
+        if self._launcher_menu is None:
+            self._rebuild_launcher_menu()
+
+        menu = self._launcher_menu
+
+        # Show menu at mouse position
+        try:
+            menu.tk_popup(self.root.winfo_pointerx(), self.root.winfo_pointery())
+        finally:
+            menu.grab_release()
+
+    def _rebuild_launcher_menu(self):
+        """Rebuild the cached popup menu from the current configs"""
         menu = tk.Menu(self.root, tearoff=0)
 
         # Add header
-        menu.add_command(label="▼ APPLICATIONS", state="disabled")
+        menu.add_command(label=HEADER_APPS, state="disabled")
         menu.add_separator()
 
         # Add each app to the menu
         for app_config in self.all_configs:
-            # Load icon (from file if available, otherwise generate from initial)
-            icon_image = self.load_icon(app_config.icon, app_config.name)
+            # Icons were pre-rendered during reload_configs
+            icon_image = self._icon_by_app.get(id(app_config))
 
             # Get menu flow to determine if we need submenus
             flow = self.menu_builder.get_menu_flow(app_config)
 
             if flow == "direct":
-                # Simple menu item that launches directly
+                # Simple menu item that launches directly. partial is a
+                # C-level callable - cheaper than a closure per item
                 menu.add_command(
                     label=app_config.name,
                     image=icon_image,
                     compound='left',
-                    command=lambda ac=app_config: self.menu_builder.launch_app_with_config(ac)
+                    command=partial(self.menu_builder.launch_app_with_config, app_config)
                 )
             else:
                 # Add cascading submenu
@@ -183,24 +287,20 @@ class LauncherApp:
 
         # Create Options submenu
         options_menu = tk.Menu(menu, tearoff=0)
-        options_menu.add_command(label="Add App...", command=lambda: self.show_add_app_wizard())
-        options_menu.add_command(label="Open Config Directory", command=lambda: self.open_config_directory())
-        options_menu.add_command(label="Reload Configs", command=lambda: self.reload_menu_action())
+        options_menu.add_command(label="Add App...", command=self.show_add_app_wizard)
+        options_menu.add_command(label="Open Config Directory", command=self.open_config_directory)
+        options_menu.add_command(label="Reload Configs", command=self.reload_menu_action)
 
         # Dynamic startup menu item
         startup_label = "Remove from Startup" if self.startup_manager.is_in_startup() else "Add to Startup"
-        options_menu.add_command(label=startup_label, command=lambda: self.toggle_startup())
+        options_menu.add_command(label=startup_label, command=self.toggle_startup)
 
         menu.add_cascade(label="Options", menu=options_menu)
 
         menu.add_separator()
-        menu.add_command(label="Quit", command=lambda: self.quit_app())
+        menu.add_command(label="Quit", command=self.quit_app)
 
-        # Show menu at mouse position
-        try:
-            menu.tk_popup(self.root.winfo_pointerx(), self.root.winfo_pointery())
-        finally:
-            menu.grab_release()
+        self._launcher_menu = menu
 
     def _build_app_submenu(self, app_config: AppConfig, flow: str):
         """Build cascading submenu for an app"""
@@ -208,7 +308,7 @@ class LauncherApp:
 
         if flow == "env_only":
             # Add header
-            submenu.add_command(label="▼ ENVIRONMENT", state="disabled")
+            submenu.add_command(label=HEADER_ENV, state="disabled")
             submenu.add_separator()
 
             # Show env file options
@@ -216,14 +316,13 @@ class LauncherApp:
             for display_name, env_file in env_items:
                 submenu.add_command(
                     label=display_name,
-                    command=lambda ef=env_file: self.menu_builder.launch_app_with_config(
-                        app_config, env_file=ef
-                    )
+                    command=partial(self.menu_builder.launch_app_with_config,
+                                    app_config, env_file=env_file)
                 )
 
         elif flow == "param_only":
             # Add header
-            submenu.add_command(label="▼ PARAMETERS", state="disabled")
+            submenu.add_command(label=HEADER_PARAMS, state="disabled")
             submenu.add_separator()
 
             # Show parameter set options
@@ -231,33 +330,31 @@ class LauncherApp:
             for display_name, param_set in param_items:
                 submenu.add_command(
                     label=display_name,
-                    command=lambda ps=param_set: self.menu_builder.launch_app_with_config(
-                        app_config, param_set=ps
-                    )
+                    command=partial(self.menu_builder.launch_app_with_config,
+                                    app_config, param_set=param_set)
                 )
 
         else:  # env_then_param
             # Add header
-            submenu.add_command(label="▼ ENVIRONMENT", state="disabled")
+            submenu.add_command(label=HEADER_ENV, state="disabled")
             submenu.add_separator()
 
             # Show env options, each with param submenus
             env_items = self.menu_builder.build_env_menu_items(app_config)
+            param_items = self.menu_builder.build_param_menu_items(app_config)
             for display_name, env_file in env_items:
                 # Create submenu for this env option
                 env_submenu = tk.Menu(submenu, tearoff=0)
 
                 # Add header to param submenu
-                env_submenu.add_command(label="▼ PARAMETERS", state="disabled")
+                env_submenu.add_command(label=HEADER_PARAMS, state="disabled")
                 env_submenu.add_separator()
 
-                param_items = self.menu_builder.build_param_menu_items(app_config)
                 for param_name, param_set in param_items:
                     env_submenu.add_command(
                         label=param_name,
-                        command=lambda ef=env_file, ps=param_set: self.menu_builder.launch_app_with_config(
-                            app_config, env_file=ef, param_set=ps
-                        )
+                        command=partial(self.menu_builder.launch_app_with_config,
+                                        app_config, env_file=env_file, param_set=param_set)
                     )
 
                 submenu.add_cascade(label=display_name, menu=env_submenu)
@@ -266,6 +363,9 @@ class LauncherApp:
 
     def show_add_app_wizard(self, icon=None, item=None):
         """Show the add app wizard"""
+        # Imported lazily - the wizard (and its venv/env scanning helpers)
+        # isn't needed until the user actually opens it
+        from app_wizard import AppWizard
         wizard = AppWizard(self.root, self.config_dir, on_complete_callback=self.reload_configs)
 
     def open_config_directory(self, icon=None, item=None):
@@ -279,23 +379,25 @@ class LauncherApp:
 
     def toggle_startup(self, icon=None, item=None):
         """Toggle launcher in Windows startup"""
+        from tkinter import messagebox
+
         if self.startup_manager.is_in_startup():
             # Remove from startup
             if self.startup_manager.remove_from_startup():
                 print("Removed from startup")
-                from tkinter import messagebox
+                # Startup label changed - rebuild the cached menu
+                self._rebuild_launcher_menu()
                 messagebox.showinfo("Startup", "Launcher removed from Windows startup")
             else:
-                from tkinter import messagebox
                 messagebox.showerror("Error", "Failed to remove from startup")
         else:
             # Add to startup
             if self.startup_manager.add_to_startup():
                 print("Added to startup")
-                from tkinter import messagebox
+                # Startup label changed - rebuild the cached menu
+                self._rebuild_launcher_menu()
                 messagebox.showinfo("Startup", "Launcher added to Windows startup")
             else:
-                from tkinter import messagebox
                 messagebox.showerror("Error", "Failed to add to startup")
 
     def quit_app(self, icon=None, item=None):
@@ -316,9 +418,17 @@ class LauncherApp:
 
     def setup_system_tray(self):
         """Setup the system tray icon and menu"""
+        # pystray drags in a win32 backend; defer its import until the
+        # tray icon is actually created
+        import pystray
+
         icon_image = self.create_icon_image()
 
-        # Dynamic startup menu item
+        # Warm the startup-state cache now; pystray re-queries dynamic
+        # labels on every tray-menu refresh and should never hit the disk
+        self.startup_manager.is_in_startup()
+
+        # Dynamic startup menu item (reads the cached state)
         def get_startup_label(item):
             return "Remove from Startup" if self.startup_manager.is_in_startup() else "Add to Startup"
 
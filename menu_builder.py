@@ -5,20 +5,50 @@ from pathlib import Path
 from typing import List, Optional, Callable
 from config_loader import AppConfig
 from variable_resolver import VariableResolver
-from app_launcher import launch_app
+from app_launcher import launch_app_async
 
 
 class MenuBuilder:
     """Builds and manages menu navigation logic"""
 
-    def __init__(self, on_launch_callback: Optional[Callable] = None):
+    def __init__(self, on_launch_callback: Optional[Callable] = None, parent=None):
         """
         Initialize menu builder.
 
         Args:
             on_launch_callback: Optional callback to call after successful launch
+            parent: Optional Tk root used to parent variable-prompt dialogs
         """
         self.on_launch_callback = on_launch_callback
+        self.parent = parent
+
+        # Per-config memoization for menu construction, keyed by
+        # id(app_config); cleared via clear_caches() on config reload.
+        # Explicit dicts rather than functools.lru_cache: invalidation
+        # is deterministic and entries can't pin stale AppConfig objects
+        # past a reload.
+        self._flow_cache = {}
+        self._env_items_cache = {}
+        self._param_items_cache = {}
+        self._env_files_cache = {}
+
+    def clear_caches(self):
+        """Drop memoized menu data (call after configs are reloaded)"""
+        self._flow_cache.clear()
+        self._env_items_cache.clear()
+        self._param_items_cache.clear()
+        self._env_files_cache.clear()
+
+    def _env_files(self, app_config: AppConfig) -> List[Path]:
+        """Memoized app_config.get_all_env_files(); it is queried both to
+        decide the menu flow and to build the env items, and even a
+        cache hit inside AppConfig still stats the env directory."""
+        key = id(app_config)
+        files = self._env_files_cache.get(key)
+        if files is None:
+            files = app_config.get_all_env_files()
+            self._env_files_cache[key] = files
+        return files
 
     def launch_app_with_config(
         self,
@@ -41,7 +71,7 @@ class MenuBuilder:
 
             # Resolve variables in parameters
             if "$" in params:
-                resolver = VariableResolver(app_config.variables)
+                resolver = VariableResolver(app_config.variables, parent=self.parent)
                 resolved_params = resolver.resolve_parameters(params)
 
                 if resolved_params is None:
@@ -55,18 +85,20 @@ class MenuBuilder:
         if env_file:
             env_files = [env_file]
 
-        # Launch the app
-        success = launch_app(
+        # Launch the app on a worker thread so the menu/UI doesn't freeze
+        on_success = None
+        if self.on_launch_callback:
+            on_success = lambda: self.on_launch_callback(app_config)
+
+        launch_app_async(
             script_path=app_config.script,
             parameters=params,
             venv_path=app_config.venv,
             env_files=env_files,
-            working_directory=app_config.working_directory
+            working_directory=app_config.working_directory,
+            on_success=on_success
         )
 
-        if success and self.on_launch_callback:
-            self.on_launch_callback(app_config)
-
     def should_show_env_menu(self, app_config: AppConfig) -> bool:
         """
         Determine if we should show the env selection menu.
@@ -74,8 +106,7 @@ class MenuBuilder:
         Returns:
             True if app has env files configured
         """
-        env_files = app_config.get_all_env_files()
-        return len(env_files) > 0
+        return len(self._env_files(app_config)) > 0
 
     def should_show_param_menu(self, app_config: AppConfig) -> bool:
         """
@@ -93,17 +124,24 @@ class MenuBuilder:
         Returns:
             One of: "direct", "env_only", "param_only", "env_then_param"
         """
+        flow = self._flow_cache.get(id(app_config))
+        if flow is not None:
+            return flow
+
         has_env = self.should_show_env_menu(app_config)
         has_param = self.should_show_param_menu(app_config)
 
         if not has_env and not has_param:
-            return "direct"
+            flow = "direct"
         elif has_env and not has_param:
-            return "env_only"
+            flow = "env_only"
         elif not has_env and has_param:
-            return "param_only"
+            flow = "param_only"
         else:
-            return "env_then_param"
+            flow = "env_then_param"
+
+        self._flow_cache[id(app_config)] = flow
+        return flow
 
     def build_env_menu_items(self, app_config: AppConfig) -> List[tuple]:
         """
@@ -112,7 +150,11 @@ class MenuBuilder:
         Returns:
             List of (display_name, env_file_path) tuples
         """
-        env_files = app_config.get_all_env_files()
+        items = self._env_items_cache.get(id(app_config))
+        if items is not None:
+            return items
+
+        env_files = self._env_files(app_config)
         items = []
 
         # Add "No env file" option
@@ -123,6 +165,7 @@ class MenuBuilder:
             display_name = env_file.name
             items.append((display_name, env_file))
 
+        self._env_items_cache[id(app_config)] = items
         return items
 
     def build_param_menu_items(self, app_config: AppConfig) -> List[tuple]:
@@ -132,6 +175,10 @@ class MenuBuilder:
         Returns:
             List of (display_name, param_set_dict) tuples
         """
+        items = self._param_items_cache.get(id(app_config))
+        if items is not None:
+            return items
+
         items = []
 
         for param_set in app_config.parameter_sets:
@@ -142,4 +189,5 @@ class MenuBuilder:
         if not items:
             items.append(("Run", {"name": "Run", "params": ""}))
 
+        self._param_items_cache[id(app_config)] = items
         return items
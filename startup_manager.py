@@ -4,7 +4,11 @@ Startup Manager - Add/remove launcher from Windows startup
 from pathlib import Path
 import os
 import sys
-import win32com.client
+
+from venv_detector import detect_venv
+
+# Sentinel for "venv detection not run yet" (None is a valid result)
+_UNSET = object()
 
 
 class StartupManager:
@@ -18,9 +22,26 @@ class StartupManager:
         self.batch_path = launcher_script.parent / self.batch_name
         self.shortcut_path = self.startup_dir / self.shortcut_name
 
+        # Lazily created COM shell and cached startup state; the state
+        # only changes through add/remove below
+        self._shell = None
+        self._in_startup_cache = None
+        self._venv_cache = _UNSET
+
+    def _get_shell(self):
+        """Create the WScript.Shell COM object once (Dispatch is expensive)"""
+        if self._shell is None:
+            # pywin32 is only needed when the user actually toggles
+            # startup, so don't pay its import cost at module load
+            import win32com.client
+            self._shell = win32com.client.Dispatch("WScript.Shell")
+        return self._shell
+
     def is_in_startup(self) -> bool:
         """Check if launcher is currently in startup"""
-        return self.shortcut_path.exists()
+        if self._in_startup_cache is None:
+            self._in_startup_cache = self.shortcut_path.exists()
+        return self._in_startup_cache
 
     def add_to_startup(self) -> bool:
         """Add launcher to startup"""
@@ -47,14 +68,14 @@ class StartupManager:
                 f.write('\n'.join(batch_lines))
 
             # Create shortcut to batch file
-            shell = win32com.client.Dispatch("WScript.Shell")
-            shortcut = shell.CreateShortCut(str(self.shortcut_path))
+            shortcut = self._get_shell().CreateShortCut(str(self.shortcut_path))
             shortcut.TargetPath = str(self.batch_path)
             shortcut.WorkingDirectory = str(self.launcher_script.parent)
             shortcut.IconLocation = sys.executable  # Python icon
             shortcut.WindowStyle = 7  # Minimized
             shortcut.save()
 
+            self._in_startup_cache = True
             return True
 
         except Exception as e:
@@ -72,6 +93,7 @@ class StartupManager:
             if self.batch_path.exists():
                 self.batch_path.unlink()
 
+            self._in_startup_cache = False
             return True
 
         except Exception as e:
@@ -79,23 +101,11 @@ class StartupManager:
             return False
 
     def _detect_venv(self) -> Path | None:
-        """Detect virtual environment"""
-        # Check common venv locations relative to launcher script
-        script_dir = self.launcher_script.parent
-        parent_dir = script_dir.parent
-
-        venv_names = ['venv', '.venv', 'env', '.env', 'virtualenv']
-
-        # Check parent directory (most likely location)
-        for venv_name in venv_names:
-            venv_path = parent_dir / venv_name
-            if (venv_path / "Scripts" / "python.exe").exists():
-                return venv_path
-
-        # Check script directory
-        for venv_name in venv_names:
-            venv_path = script_dir / venv_name
-            if (venv_path / "Scripts" / "python.exe").exists():
-                return venv_path
-
-        return None
+        """Detect virtual environment for the launcher script.
+
+        The launcher script path never changes for the process lifetime,
+        so the probe (a handful of stat calls) runs at most once.
+        """
+        if self._venv_cache is _UNSET:
+            self._venv_cache = detect_venv(self.launcher_script)
+        return self._venv_cache
@@ -7,22 +7,37 @@ from tkinter import filedialog, simpledialog
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
-import pyperclip
+# Matches $variable references in parameter strings
+_VAR_PATTERN = re.compile(r'\$(\w+)')
 
 
 class VariableResolver:
     """Resolves variables in parameter strings"""
 
-    def __init__(self, variables_config: Dict):
+    def __init__(self, variables_config: Dict, parent=None):
         """
         Initialize with variables configuration from app config.
 
         Args:
             variables_config: Dictionary of variable definitions from JSON
+            parent: Optional Tk root to parent dialogs on; without one,
+                each prompt spins up (and tears down) its own hidden
+                Tcl interpreter
         """
         self.variables_config = variables_config
+        self._parent = parent
         self.resolved_values = {}
 
+        # O(1) dispatch by variable type instead of an if/elif ladder
+        self._handlers = {
+            "filepicker": self._prompt_file_picker,
+            "folderpicker": self._prompt_folder_picker,
+            "input": self._prompt_input,
+            "datetime": self._resolve_datetime,
+            "timestamp": self._resolve_timestamp,
+            "clipboard": self._resolve_clipboard,
+        }
+
     def resolve_parameters(self, params: str) -> Optional[str]:
         """
         Resolve all variables in a parameter string.
@@ -33,25 +48,29 @@ class VariableResolver:
         Returns:
             Resolved parameter string, or None if user cancelled
         """
-        # Find all $variable references
-        pattern = r'\$(\w+)'
-        variables_found = re.findall(pattern, params)
-
-        # Resolve each unique variable
-        for var_name in set(variables_found):
-            if var_name not in self.resolved_values:
-                value = self._resolve_variable(var_name)
-                if value is None:
-                    # User cancelled
-                    return None
-                self.resolved_values[var_name] = value
+        # Nothing to resolve
+        if '$' not in params:
+            return params
+
+        # Resolve each $variable reference; resolved_values doubles as
+        # the "seen" set, so no intermediate list or set is built
+        for match in _VAR_PATTERN.finditer(params):
+            var_name = match.group(1)
+            if var_name in self.resolved_values:
+                continue
+
+            value = self._resolve_variable(var_name)
+            if value is None:
+                # User cancelled
+                return None
+            self.resolved_values[var_name] = value
 
         # Substitute all variables in params
         def replace_var(match):
             var_name = match.group(1)
             return self.resolved_values.get(var_name, match.group(0))
 
-        return re.sub(pattern, replace_var, params)
+        return _VAR_PATTERN.sub(replace_var, params)
 
     def _resolve_variable(self, var_name: str) -> Optional[str]:
         """
@@ -68,91 +87,106 @@ class VariableResolver:
         var_type = var_config.get("type", "input")
         default = var_config.get("default", "")
 
-        if var_type == "filepicker":
-            return self._prompt_file_picker(var_config, default)
-
-        elif var_type == "folderpicker":
-            return self._prompt_folder_picker(var_config, default)
-
-        elif var_type == "input":
-            return self._prompt_input(var_config, default)
-
-        elif var_type == "datetime":
-            # Support custom format via 'format' field, with sensible defaults
-            format_str = var_config.get("format", "%Y-%m-%d_%H-%M-%S")
-            try:
-                return datetime.now().strftime(format_str)
-            except Exception as e:
-                print(f"Warning: Invalid datetime format '{format_str}': {e}")
-                return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-
-        elif var_type == "timestamp":
-            return str(int(datetime.now().timestamp()))
-
-        elif var_type == "clipboard":
-            try:
-                return pyperclip.paste()
-            except Exception as e:
-                print(f"Warning: Failed to get clipboard: {e}")
-                return ""
-
-        else:
+        handler = self._handlers.get(var_type)
+        if handler is None:
             print(f"Warning: Unknown variable type '{var_type}' for ${var_name}")
             return default
 
-    def _prompt_file_picker(self, var_config: Dict, default: str) -> Optional[str]:
-        """Show file picker dialog"""
+        return handler(var_config, default)
+
+    def _resolve_datetime(self, var_config: Dict, default: str) -> str:
+        """Format the current time"""
+        # Support custom format via 'format' field, with sensible defaults
+        format_str = var_config.get("format", "%Y-%m-%d_%H-%M-%S")
+        try:
+            return datetime.now().strftime(format_str)
+        except Exception as e:
+            print(f"Warning: Invalid datetime format '{format_str}': {e}")
+            return datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+    def _resolve_timestamp(self, var_config: Dict, default: str) -> str:
+        """Current Unix timestamp in seconds"""
+        return str(int(datetime.now().timestamp()))
+
+    def _resolve_clipboard(self, var_config: Dict, default: str) -> str:
+        """Current clipboard contents"""
+        try:
+            import pyperclip
+            return pyperclip.paste()
+        except Exception as e:
+            print(f"Warning: Failed to get clipboard: {e}")
+            return ""
+
+    def _dialog_parent(self):
+        """
+        Return (parent_window, owns_it) for a dialog.
+
+        Reuses the launcher's hidden root when one was supplied; the
+        throwaway-Tk fallback only exists for standalone use.
+        """
+        if self._parent is not None:
+            return self._parent, False
+
         root = tk.Tk()
         root.withdraw()
         root.attributes('-topmost', True)
+        return root, True
+
+    def _prompt_file_picker(self, var_config: Dict, default: str) -> Optional[str]:
+        """Show file picker dialog"""
+        parent, owns_parent = self._dialog_parent()
 
         prompt = var_config.get("prompt", "Select a file")
         initial_dir = Path(default).parent if default and Path(default).exists() else None
 
-        result = filedialog.askopenfilename(
-            title=prompt,
-            initialdir=initial_dir,
-            initialfile=Path(default).name if default else ""
-        )
-
-        root.destroy()
+        try:
+            result = filedialog.askopenfilename(
+                title=prompt,
+                initialdir=initial_dir,
+                initialfile=Path(default).name if default else "",
+                parent=parent
+            )
+        finally:
+            if owns_parent:
+                parent.destroy()
 
         return result if result else (default if default else None)
 
     def _prompt_folder_picker(self, var_config: Dict, default: str) -> Optional[str]:
         """Show folder picker dialog"""
-        root = tk.Tk()
-        root.withdraw()
-        root.attributes('-topmost', True)
+        parent, owns_parent = self._dialog_parent()
 
         prompt = var_config.get("prompt", "Select a folder")
         initial_dir = default if default and Path(default).exists() else None
 
-        result = filedialog.askdirectory(
-            title=prompt,
-            initialdir=initial_dir
-        )
-
-        root.destroy()
+        try:
+            result = filedialog.askdirectory(
+                title=prompt,
+                initialdir=initial_dir,
+                parent=parent
+            )
+        finally:
+            if owns_parent:
+                parent.destroy()
 
         return result if result else (default if default else None)
 
     def _prompt_input(self, var_config: Dict, default: str) -> Optional[str]:
         """Show text input dialog"""
-        root = tk.Tk()
-        root.withdraw()
-        root.attributes('-topmost', True)
+        parent, owns_parent = self._dialog_parent()
 
         prompt = var_config.get("prompt", "Enter value")
 
-        result = simpledialog.askstring(
-            "Input Required",
-            prompt,
-            initialvalue=default,
-            parent=root
-        )
-
-        root.destroy()
+        try:
+            result = simpledialog.askstring(
+                "Input Required",
+                prompt,
+                initialvalue=default,
+                parent=parent
+            )
+        finally:
+            if owns_parent:
+                parent.destroy()
 
         return result if result is not None else (default if default else None)
 
@@ -2,8 +2,27 @@
 Virtual Environment Detector
 Automatically discovers virtual environments for Python projects
 """
+import os
 from pathlib import Path
 
+# Common venv directory names
+_VENV_NAMES = ('venv', '.venv', 'virtualenv', 'env', '.env')
+
+
+def _iter_candidates(script_dir: Path):
+    """Yield (base_dir, venv_name, probe_path) candidates in
+    likeliest-first order. The probe path is a plain string so checking
+    it costs one os.path.exists with no Path allocations."""
+    parent_dir = script_dir.parent
+
+    # Parent directory first (most common location), then the script
+    # directory itself, then the grandparent
+    for directory in (parent_dir, script_dir, parent_dir.parent):
+        dir_str = str(directory)
+        for venv_name in _VENV_NAMES:
+            yield directory, venv_name, os.path.join(
+                dir_str, venv_name, "Scripts", "python.exe")
+
 
 def detect_venv(script_path: Path | str) -> Path | None:
     """
@@ -19,28 +38,11 @@ def detect_venv(script_path: Path | str) -> Path | None:
         script_path = Path(script_path)
 
     script_dir = script_path.parent if script_path.is_file() else script_path
-    parent_dir = script_dir.parent
 
-    # Common venv directory names
-    venv_names = ['venv', '.venv', 'virtualenv']
-
-    # Check parent directory first (most common location)
-    for venv_name in venv_names:
-        venv_path = parent_dir / venv_name
-        if (venv_path / "Scripts" / "python.exe").exists():
-            return venv_path
-
-    # Check script directory
-    for venv_name in venv_names:
-        venv_path = script_dir / venv_name
-        if (venv_path / "Scripts" / "python.exe").exists():
-            return venv_path
-
-    # Check grandparent directory
-    grandparent_dir = parent_dir.parent
-    for venv_name in venv_names:
-        venv_path = grandparent_dir / venv_name
-        if (venv_path / "Scripts" / "python.exe").exists():
-            return venv_path
+    # Lazy candidate iteration stops stat'ing as soon as a venv is
+    # found; only the returned path is wrapped in a Path object
+    for directory, venv_name, probe_path in _iter_candidates(script_dir):
+        if os.path.exists(probe_path):
+            return directory / venv_name
 
     return None